@@ -1,2 +1,2 @@
 from .config import get_settings
-from .logs import get_logger
+from .logs import get_logger, shutdown_loki_handler
@@ -140,8 +140,19 @@ class MailingSettings(BaseConfig, env_prefix="CELERY_TASKS_MAILING_"):
         )
 
 
+class MailingStatsSettings(BaseConfig, env_prefix="CELERY_TASKS_MAILING_STATS_"):
+    cache_ttl_seconds: int
+    throughput_window_minutes: int
+    read_from_secondary: bool
+
+    @property
+    def throughput_window_timedelta(self) -> timedelta:
+        return timedelta(minutes=self.throughput_window_minutes)
+
+
 class CeleryTasksSettings(BaseConfig):
     mailing: MailingSettings = MailingSettings()
+    mailing_stats: MailingStatsSettings = MailingStatsSettings()
 
 
 class BeanieDocumentsSettings(BaseConfig, env_prefix="CELERY_BEANIE_DOCUMENTS_"):
@@ -196,6 +207,9 @@ class ApiSettings(BaseConfig, env_prefix="CELERY_API_"):
     version: str
     host: str
     port: int
+    workers: int
+    graceful_shutdown_timeout_seconds: int
+    access_log: bool
     debug: bool
     openapi_url: str
     docs_url: str
@@ -1,4 +1,6 @@
 import logging
+import os
+from functools import lru_cache
 from multiprocessing import Queue
 
 from celery.utils.log import get_task_logger
@@ -6,16 +8,45 @@ from logging_loki import LokiQueueHandler
 
 from .config import get_settings
 
-loki_handler = LokiQueueHandler(
-    Queue(-1),
-    url=get_settings().logging.loki_endpoint,
-    tags={"app": get_settings().api.title},
-    version=get_settings().logging.loki_handler_version,
-)
+
+@lru_cache
+def get_loki_handler() -> LokiQueueHandler:
+    return LokiQueueHandler(
+        Queue(-1),
+        url=get_settings().logging.loki_endpoint,
+        tags={"app": get_settings().api.title},
+        version=get_settings().logging.loki_handler_version,
+    )
+
+
+def _recreate_loki_handler_after_fork() -> None:
+    # The queue listener thread does not survive a fork, loggers created by the parent get a fresh handler.
+    if not get_loki_handler.cache_info().currsize:
+        return
+
+    inherited_handler = get_loki_handler()
+    get_loki_handler.cache_clear()
+
+    for logger in logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger) and inherited_handler in logger.handlers:
+            logger.removeHandler(inherited_handler)
+            logger.addHandler(get_loki_handler())
+
+
+os.register_at_fork(after_in_child=_recreate_loki_handler_after_fork)
 
 
 def get_logger(name: str) -> logging.Logger:
     logger = get_task_logger(name)
     logger.setLevel(get_settings().logging.log_level)
-    logger.addHandler(loki_handler)
+    logger.addHandler(get_loki_handler())
     return logger
+
+
+def shutdown_loki_handler() -> None:
+    if not get_loki_handler.cache_info().currsize:
+        return
+
+    # Stopping the listener flushes records still waiting in the queue.
+    get_loki_handler().listener.stop()
+    get_loki_handler.cache_clear()
@@ -1,2 +1,2 @@
 from .models import EmailBase, EmailOutboxMessage
-from .session import get_session, db_init_lifespan
+from .session import get_client, get_database, get_session, db_init_lifespan
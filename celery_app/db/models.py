@@ -4,6 +4,7 @@ from typing import Annotated
 from beanie import Document, TimeSeriesConfig, Granularity
 from fastapi_mail import MessageType
 from pydantic import EmailStr
+from pymongo import IndexModel, ASCENDING
 from sqlmodel import SQLModel, Field
 
 from core import get_settings
@@ -46,6 +47,7 @@ class EmailOutboxMessage(BaseDocument):
     class Settings(BaseDocumentSettings):
         name = "outbox_emails"
         timeseries = _timeseries_settings("created_at")
+        indexes = [IndexModel([("is_processed", ASCENDING), ("created_at", ASCENDING)])]
 
     @classmethod
     def create_email(
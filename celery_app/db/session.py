@@ -1,25 +1,39 @@
+import os
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator, Any
 
 from beanie import init_beanie
 from fastapi import FastAPI
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession, AsyncIOMotorDatabase
 
 from core import get_settings
 from .models import EmailOutboxMessage
 
-client = AsyncIOMotorClient(get_settings().mongo_db.mongo_dsn)
-celery_db = client.get_database(name=get_settings().mongo_db.path)
+
+@lru_cache
+def get_client() -> AsyncIOMotorClient:
+    return AsyncIOMotorClient(get_settings().mongo_db.mongo_dsn)
+
+
+# Motor clients are not fork-safe, every forked API worker has to open its own connection pool.
+os.register_at_fork(after_in_child=get_client.cache_clear)
+
+
+def get_database() -> AsyncIOMotorDatabase:
+    return get_client().get_database(name=get_settings().mongo_db.path)
 
 
 async def get_session() -> AsyncGenerator[AsyncIOMotorClientSession, Any]:
-    async with await client.start_session(causal_consistency=get_settings().mongo_db.causal_consistency) as session:
+    async with await get_client().start_session(
+        causal_consistency=get_settings().mongo_db.causal_consistency
+    ) as session:
         yield session
 
 
 async def init_db() -> None:
     await init_beanie(
-        database=celery_db,
+        database=get_database(),
         document_models=[EmailOutboxMessage],
         multiprocessing_mode=get_settings().mongo_db.multiprocessing_mode,
     )
@@ -29,3 +43,5 @@ async def init_db() -> None:
 async def db_init_lifespan(_: FastAPI) -> None:
     await init_db()
     yield
+    get_client().close()
+    get_client.cache_clear()
@@ -16,6 +16,10 @@ def _create_jinja_templates() -> Jinja2Templates:
         context_processors=[_context],
     )
 
+    # Compile every template up front, so forked API workers share the compiled code instead of building their own.
+    for template_name in jinja_templates.env.list_templates():
+        jinja_templates.get_template(template_name)
+
     return jinja_templates
 
 
@@ -23,7 +27,7 @@ templates: Jinja2Templates = _create_jinja_templates()
 
 
 def extract_template_variables(template_name: str) -> list[str]:
-    env = get_settings().resources.jinja_env
+    env = templates.env
     template_source = env.loader.get_source(env, template_name)
     parsed_content = env.parse(template_source)
     return list(meta.find_undeclared_variables(parsed_content))
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Annotated, Any
 
 from fastapi_mail import MessageType
@@ -75,3 +76,42 @@ class EmailSchema(SQLModel):
             body_params=body_params,
             body=body,
         )
+
+
+class OutboxBacklogStats(SQLModel):
+    pending: Annotated[int, Field(title="Number of emails waiting to be sent")]
+    processed: Annotated[int, Field(title="Number of emails enqueued within the throughput window and already sent")]
+    oldest_pending_at: Annotated[datetime | None, Field(title="Creation date of the oldest pending email")]
+    pending_age_seconds_p50: Annotated[float | None, Field(title="Median age of pending emails in seconds")]
+    pending_age_seconds_p90: Annotated[float | None, Field(title="90th percentile age of pending emails in seconds")]
+    pending_age_seconds_p99: Annotated[float | None, Field(title="99th percentile age of pending emails in seconds")]
+
+
+class OutboxMinuteThroughput(SQLModel):
+    minute: Annotated[datetime, Field(title="Start of the minute")]
+    enqueued: Annotated[int, Field(title="Emails enqueued during the minute")]
+    processed: Annotated[
+        int,
+        Field(
+            title="Emails enqueued during the minute which are already sent",
+            description="Not a send rate, outbox emails do not record when they were sent",
+        ),
+    ]
+
+
+class OutboxStats(SQLModel):
+    generated_at: Annotated[
+        datetime,
+        Field(
+            title="Date when stats were computed",
+            description="Stats are cached for a few seconds by each API worker process separately",
+        ),
+    ]
+    backlog: Annotated[OutboxBacklogStats, Field(title="Outbox backlog")]
+    throughput: Annotated[
+        list[OutboxMinuteThroughput],
+        Field(
+            title="Per-minute enqueue throughput, oldest minute first",
+            description="Emails are bucketed by the minute they were enqueued in, idle minutes are reported as zeros",
+        ),
+    ]
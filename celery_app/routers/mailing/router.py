@@ -9,7 +9,8 @@ from starlette.responses import HTMLResponse
 
 from db import get_session, EmailOutboxMessage
 from .funcs import templates, extract_template_variables
-from .models import EmailSchema
+from .models import EmailSchema, OutboxStats
+from .stats import get_outbox_stats
 
 mail_router = APIRouter(
     prefix="/tasks/mail", tags=["mail"], include_in_schema=True, default_response_class=ORJSONResponse
@@ -64,3 +65,10 @@ async def variables_required_by_template(name: Annotated[str, Path(title="Templa
     template_variables = extract_template_variables(template.name)
 
     return ORJSONResponse(content={"variables to provide": template_variables}, status_code=status.HTTP_200_OK)
+
+
+@mail_router.get("/stats", response_model=OutboxStats)
+async def outbox_stats() -> ORJSONResponse:
+    stats = await get_outbox_stats()
+
+    return ORJSONResponse(content=stats.model_dump(mode="json"), status_code=status.HTTP_200_OK)
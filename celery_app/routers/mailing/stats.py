@@ -0,0 +1,115 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReadPreference
+
+from core import get_settings
+from db import EmailOutboxMessage
+from .models import OutboxStats, OutboxBacklogStats, OutboxMinuteThroughput
+
+_AGE_PERCENTILES = [0.5, 0.9, 0.99]
+
+_cached_stats: tuple[float, OutboxStats] | None = None
+_cache_lock = asyncio.Lock()
+
+
+def _outbox_collection() -> AsyncIOMotorCollection:
+    collection = EmailOutboxMessage.get_motor_collection()
+    if get_settings().tasks.mailing_stats.read_from_secondary:
+        return collection.with_options(read_preference=ReadPreference.SECONDARY_PREFERRED)
+    return collection
+
+
+def _pending_pipeline() -> list[dict[str, Any]]:
+    return [
+        {"$match": {"is_processed": False}},
+        {
+            "$group": {
+                "_id": None,
+                "count": {"$sum": 1},
+                "oldest": {"$min": "$created_at"},
+                "age_percentiles": {
+                    "$percentile": {
+                        "input": {"$dateDiff": {"startDate": "$created_at", "endDate": "$$NOW", "unit": "second"}},
+                        "p": _AGE_PERCENTILES,
+                        "method": "approximate",
+                    }
+                },
+            }
+        },
+    ]
+
+
+def _throughput_pipeline(since: datetime) -> list[dict[str, Any]]:
+    return [
+        {"$match": {"created_at": {"$gte": since}}},
+        {
+            "$group": {
+                "_id": {"$dateTrunc": {"date": "$created_at", "unit": "minute"}},
+                "enqueued": {"$sum": 1},
+                "processed": {"$sum": {"$cond": ["$is_processed", 1, 0]}},
+            }
+        },
+    ]
+
+
+def _zero_filled_throughput(
+    buckets: list[dict[str, Any]], since: datetime, until: datetime
+) -> list[OutboxMinuteThroughput]:
+    # Idle minutes are reported as zeros instead of missing from the series, even when the whole window is idle.
+    by_minute = {bucket["_id"].replace(tzinfo=UTC): bucket for bucket in buckets}
+    minutes = [since + timedelta(minutes=offset) for offset in range(int((until - since) / timedelta(minutes=1)) + 1)]
+
+    return [
+        OutboxMinuteThroughput(
+            minute=minute,
+            enqueued=by_minute.get(minute, {}).get("enqueued", 0),
+            processed=by_minute.get(minute, {}).get("processed", 0),
+        )
+        for minute in minutes
+    ]
+
+
+async def _aggregate_outbox_stats() -> OutboxStats:
+    now = datetime.now(UTC)
+    collection = _outbox_collection()
+    current_minute = now.replace(second=0, microsecond=0)
+    since = current_minute - get_settings().tasks.mailing_stats.throughput_window_timedelta
+
+    pending, throughput = await asyncio.gather(
+        collection.aggregate(_pending_pipeline()).to_list(length=None),
+        collection.aggregate(_throughput_pipeline(since)).to_list(length=None),
+    )
+
+    pending = pending[0] if pending else {"count": 0, "oldest": None, "age_percentiles": [None] * len(_AGE_PERCENTILES)}
+    p50, p90, p99 = pending["age_percentiles"]
+
+    return OutboxStats(
+        generated_at=now,
+        backlog=OutboxBacklogStats(
+            pending=pending["count"],
+            processed=sum(bucket["processed"] for bucket in throughput),
+            oldest_pending_at=pending["oldest"].replace(tzinfo=UTC) if pending["oldest"] else None,
+            pending_age_seconds_p50=p50,
+            pending_age_seconds_p90=p90,
+            pending_age_seconds_p99=p99,
+        ),
+        throughput=_zero_filled_throughput(throughput, since, current_minute),
+    )
+
+
+async def get_outbox_stats() -> OutboxStats:
+    global _cached_stats
+
+    # Cache is per API worker process. The lock makes concurrent pollers of one worker wait for a single aggregation
+    # instead of each hitting the database.
+    async with _cache_lock:
+        if _cached_stats and _cached_stats[0] > time.monotonic():
+            return _cached_stats[1]
+
+        stats = await _aggregate_outbox_stats()
+        _cached_stats = (time.monotonic() + get_settings().tasks.mailing_stats.cache_ttl_seconds, stats)
+        return stats
@@ -0,0 +1,161 @@
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+import uvicorn
+
+from celery_app import create_app
+from core import get_settings, shutdown_loki_handler
+
+logger = logging.getLogger("uvicorn.error")
+
+_SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+_WORKER_BOOT_ERROR = 3
+_SUPERVISOR_CHECK_INTERVAL_SECONDS = 1
+_MIN_WORKER_UPTIME_SECONDS = 10
+_MAX_RESPAWN_BACKOFF_SECONDS = 30
+
+
+def _watch_worker(server: uvicorn.Server, supervisor_pid: int, stop_requested: threading.Event) -> None:
+    while not server.should_exit:
+        if stop_requested.is_set():
+            server.should_exit = True
+        elif os.getppid() != supervisor_pid:
+            logger.warning("Supervisor %s is gone, draining API worker %s", supervisor_pid, os.getpid())
+            server.should_exit = True
+        time.sleep(_SUPERVISOR_CHECK_INTERVAL_SECONDS)
+
+
+def _run_worker(config: uvicorn.Config, sock: socket.socket, supervisor_pid: int) -> int:
+    server = uvicorn.Server(config)
+    stop_requested = threading.Event()
+
+    # uvicorn re-raises the signal it drained on after restoring these handlers, so they must not terminate the
+    # process: the worker has to reach os._exit with its own exit code. A signal arriving before uvicorn installs
+    # its handlers still stops the worker through the watcher thread.
+    for signum in _SHUTDOWN_SIGNALS:
+        signal.signal(signum, lambda *_: stop_requested.set())
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, _SHUTDOWN_SIGNALS)
+
+    threading.Thread(target=_watch_worker, args=(server, supervisor_pid, stop_requested), daemon=True).start()
+
+    server.run(sockets=[sock])
+
+    # Failed lifespan startup (e.g. unreachable Mongo) returns normally, it must not look like a clean exit.
+    return 0 if server.started else _WORKER_BOOT_ERROR
+
+
+def _spawn_worker(config: uvicorn.Config, sock: socket.socket) -> int:
+    supervisor_pid = os.getpid()
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Own process group, so Ctrl+C is delivered only to the supervisor, which then drains workers exactly once.
+    os.setpgid(0, 0)
+
+    exit_code = 0
+    try:
+        exit_code = _run_worker(config, sock, supervisor_pid)
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    except Exception:
+        logger.exception("API worker %s crashed", os.getpid())
+        exit_code = 1
+    finally:
+        shutdown_loki_handler()
+        os._exit(exit_code)
+
+
+def run() -> None:
+    settings = get_settings().api
+
+    # Preload the app before forking, settings and compiled templates are then shared copy-on-write by the workers.
+    # Mongo client and Loki queue are created lazily, inside each worker.
+    config = uvicorn.Config(
+        create_app(),
+        host=settings.host,
+        port=settings.port,
+        log_level=get_settings().logging.log_level.lower(),
+        access_log=settings.access_log,
+        loop="asyncio",
+        lifespan="on",
+        timeout_graceful_shutdown=settings.graceful_shutdown_timeout_seconds,
+    )
+    sock = config.bind_socket()
+    gc.freeze()
+
+    workers: dict[int, float] = {}
+    is_shutting_down = False
+    exit_code = 0
+
+    def _drain(reason: str) -> None:
+        nonlocal is_shutting_down
+        is_shutting_down = True
+        logger.info("%s, draining %d API workers", reason, len(workers))
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _spawn() -> None:
+        # Shutdown signals are held back until the new worker is registered, so it is never left out of the drain.
+        signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+        try:
+            workers[_spawn_worker(config, sock)] = time.monotonic()
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, _SHUTDOWN_SIGNALS)
+
+    def _shutdown(signum: int, _) -> None:
+        _drain(f"Received {signal.Signals(signum).name}")
+
+    for signum in _SHUTDOWN_SIGNALS:
+        signal.signal(signum, _shutdown)
+
+    for _ in range(settings.workers):
+        if is_shutting_down:
+            break
+        _spawn()
+
+    respawn_backoff = 0
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started_at = workers.pop(pid)
+        worker_exit_code = os.waitstatus_to_exitcode(status)
+
+        if is_shutting_down:
+            logger.info("API worker %s exited with status %s", pid, worker_exit_code)
+            continue
+
+        if worker_exit_code == _WORKER_BOOT_ERROR:
+            exit_code = _WORKER_BOOT_ERROR
+            _drain(f"API worker {pid} failed to start")
+            continue
+
+        if time.monotonic() - started_at < _MIN_WORKER_UPTIME_SECONDS:
+            respawn_backoff = min(max(respawn_backoff * 2, 1), _MAX_RESPAWN_BACKOFF_SECONDS)
+        else:
+            respawn_backoff = 0
+
+        logger.warning(
+            "API worker %s exited with status %s, respawning in %ss", pid, worker_exit_code, respawn_backoff
+        )
+        time.sleep(respawn_backoff)
+        if not is_shutting_down:
+            _spawn()
+
+    sock.close()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    run()
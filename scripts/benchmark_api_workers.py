@@ -0,0 +1,179 @@
+"""Measures how API throughput scales with the number of prod_main.py workers.
+
+Available CPUs are split in two sets: the API (supervisor and workers) is pinned to the first --server-cpus of them,
+the load generators to the rest, so clients never steal cores from the workers being measured. For every worker
+count from 1 to --max-workers (at most --server-cpus) the script starts prod_main.py, floods a cheap endpoint from
+--clients load generator processes for --duration seconds and prints requests per second next to the ideal linear
+scaling. Keep an eye on the client set: if it saturates, efficiency drops regardless of how the API scales, so give
+the load generators at least as many cores as the API.
+
+The API lifespan connects to Mongo, so start it first, e.g. `docker compose up -d mongo_db`, preferably on cores
+outside both sets.
+
+    python scripts/benchmark_api_workers.py --server-cpus 4 --duration 20
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import httpx
+
+_ROOT_DIR = Path(__file__).parent.parent
+_STARTUP_TIMEOUT_SECONDS = 30
+_LOAD_START_DELAY_SECONDS = 1
+
+
+def _parse_args() -> argparse.Namespace:
+    available_cpus = len(os.sched_getaffinity(0))
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--server-cpus", type=int, default=available_cpus // 2, help="CPUs reserved for the API")
+    parser.add_argument("--max-workers", type=int, help="Defaults to --server-cpus, cannot exceed it")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds of load per worker count")
+    parser.add_argument("--clients", type=int, help="Load generator processes, defaults to one per client CPU")
+    parser.add_argument("--concurrency", type=int, default=32, help="In-flight requests per load generator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18081)
+    parser.add_argument("--path", default="/tasks/mail/templates")
+    args = parser.parse_args()
+
+    if not 0 < args.server_cpus < available_cpus:
+        parser.error(f"--server-cpus must leave CPUs for the load generators, {available_cpus} available")
+    args.max_workers = min(args.max_workers or args.server_cpus, args.server_cpus)
+    return args
+
+
+def _split_cpus(server_cpus: int) -> tuple[set[int], set[int]]:
+    cpus = sorted(os.sched_getaffinity(0))
+    return set(cpus[:server_cpus]), set(cpus[server_cpus:])
+
+
+def _start_api(workers: int, port: int, cpus: set[int]) -> subprocess.Popen:
+    env = os.environ | {
+        "PYTHONPATH": os.pathsep.join([str(_ROOT_DIR), str(_ROOT_DIR / "celery_app")]),
+        "CELERY_API_WORKERS": str(workers),
+        "CELERY_API_PORT": str(port),
+        "CELERY_API_ACCESS_LOG": "false",
+        "CELERY_LOGGING_LOG_LEVEL": "WARNING",
+    }
+    return subprocess.Popen(
+        [sys.executable, str(_ROOT_DIR / "prod_main.py")],
+        cwd=_ROOT_DIR,
+        env=env,
+        # Forked workers inherit the affinity of the supervisor.
+        preexec_fn=lambda: os.sched_setaffinity(0, cpus),
+    )
+
+
+def _wait_until_ready(api: subprocess.Popen, url: str) -> None:
+    deadline = time.monotonic() + _STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if api.poll() is not None:
+            raise RuntimeError(f"prod_main.py exited with status {api.returncode} during startup")
+        try:
+            if httpx.get(url).is_success:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"API did not answer on {url} within {_STARTUP_TIMEOUT_SECONDS}s")
+
+
+def _stop_api(api: subprocess.Popen) -> None:
+    api.send_signal(signal.SIGTERM)
+    api.wait()
+
+
+async def _generate_load(url: str, concurrency: int, start_at: float, deadline: float) -> tuple[int, int]:
+    succeeded = failed = 0
+
+    async def _loop(client: httpx.AsyncClient) -> None:
+        nonlocal succeeded, failed
+        await asyncio.sleep(start_at - time.monotonic())
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get(url)
+            except httpx.TransportError:
+                failed += 1
+                continue
+            if time.monotonic() > deadline:
+                break
+            if response.is_success:
+                succeeded += 1
+            else:
+                failed += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+        await asyncio.gather(*(_loop(client) for _ in range(concurrency)))
+
+    return succeeded, failed
+
+
+def _run_load_generator(url: str, concurrency: int, start_at: float, deadline: float) -> tuple[int, int]:
+    return asyncio.run(_generate_load(url, concurrency, start_at, deadline))
+
+
+def _pin_load_generator(cpus: set[int]) -> None:
+    os.sched_setaffinity(0, cpus)
+
+
+def _warm_up(pool: ProcessPoolExecutor, clients: int) -> None:
+    # Forces every load generator process to start and import httpx before anything is timed.
+    list(pool.map(time.sleep, [0.1] * clients))
+
+
+def _measure(pool: ProcessPoolExecutor, url: str, clients: int, concurrency: int, duration: float) -> tuple[float, int]:
+    # Every generator opens its client first and starts sending at the same instant, the window is exactly duration.
+    start_at = time.monotonic() + _LOAD_START_DELAY_SECONDS
+    deadline = start_at + duration
+    results = list(
+        pool.map(
+            _run_load_generator, [url] * clients, [concurrency] * clients, [start_at] * clients, [deadline] * clients
+        )
+    )
+
+    succeeded = sum(result[0] for result in results)
+    failed = sum(result[1] for result in results)
+    return succeeded / duration, failed
+
+
+def main() -> None:
+    args = _parse_args()
+    url = f"http://{args.host}:{args.port}{args.path}"
+    server_cpus, client_cpus = _split_cpus(args.server_cpus)
+    clients = args.clients or len(client_cpus)
+
+    print(f"API on CPUs {sorted(server_cpus)}, {clients} load generators on CPUs {sorted(client_cpus)}")
+    print(f"GET {url}, {clients} clients x {args.concurrency} connections, {args.duration}s per run")
+    print(f"{'workers':>7} {'req/s':>10} {'linear':>10} {'efficiency':>10} {'errors':>7}")
+
+    baseline = None
+    with ProcessPoolExecutor(max_workers=clients, initializer=_pin_load_generator, initargs=(client_cpus,)) as pool:
+        _warm_up(pool, clients)
+
+        for workers in range(1, args.max_workers + 1):
+            api = _start_api(workers, args.port, server_cpus)
+            try:
+                _wait_until_ready(api, url)
+                requests_per_second, failed = _measure(pool, url, clients, args.concurrency, args.duration)
+            finally:
+                _stop_api(api)
+
+            baseline = baseline or requests_per_second
+            linear = baseline * workers
+            print(
+                f"{workers:>7} {requests_per_second:>10.1f} {linear:>10.1f} "
+                f"{requests_per_second / linear:>10.0%} {failed:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()